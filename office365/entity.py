@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 class Entity(ClientObject):
     """Base entity"""
 
+    __slots__ = ()
+
     def update(self):
         # type: () -> Self
         """Updates the entity."""
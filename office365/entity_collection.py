@@ -55,8 +55,14 @@ class EntityCollection(ClientObjectCollection[T]):
     def add(self, **kwargs):
         # type: (Any) -> T
         """Creates an entity and prepares the query"""
+        return self._add_from_payload(kwargs)
+
+    def _add_from_payload(self, properties):
+        # type: (dict) -> T
+        """Creates an entity from an already assembled payload dict, skipping
+        the keyword repacking of add() for callers that build the dict anyway"""
         return_type = self.create_typed_object(
-            kwargs, EntityPath(None, self.resource_path)
+            properties, EntityPath(None, self.resource_path)
         )
         self.add_child(return_type)
         qry = CreateEntityQuery(self, return_type, return_type)
@@ -6,6 +6,8 @@ from office365.runtime.types.collections import StringCollection
 
 
 class OutlookItem(Entity):
+    __slots__ = ()
+
     @property
     def change_key(self):
         # type: () -> Optional[str]
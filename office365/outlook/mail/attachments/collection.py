@@ -1,4 +1,4 @@
-import base64
+from binascii import b2a_base64
 
 import requests
 
@@ -24,7 +24,7 @@ class AttachmentCollection(EntityCollection[Attachment]):
 
         :param str name: The name representing the text that is displayed below the icon representing the
              embedded attachment
-        :param str or None content: The contents of the file
+        :param str or bytes or None content: The contents of the file
         :param str or None content_type: The content type of the attachment.
         :param str or None base64_content: The contents of the file in the form of a base64 string.
         """
@@ -37,7 +37,9 @@ class AttachmentCollection(EntityCollection[Attachment]):
         if base64_content:
             content = base64_content
         else:
-            content = base64.b64encode(content.encode("utf-8")).decode("utf-8")
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            content = b2a_base64(content, newline=False).decode("ascii")
         return_type.content_bytes = content
         return_type.content_type = content_type
         self.add_child(return_type)
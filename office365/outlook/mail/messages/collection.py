@@ -3,7 +3,7 @@ from typing import List
 from office365.delta_collection import DeltaCollection
 from office365.outlook.mail.item_body import ItemBody
 from office365.outlook.mail.messages.message import Message
-from office365.outlook.mail.recipient import Recipient
+from office365.outlook.mail.recipient import Recipient, _cached_from_email
 from office365.runtime.client_value_collection import ClientValueCollection
 
 
@@ -24,14 +24,14 @@ class MessageCollection(DeltaCollection[Message]):
         """
         if to_recipients is not None:
             kwargs["toRecipients"] = ClientValueCollection(
-                Recipient, [Recipient.from_email(email) for email in to_recipients]
+                Recipient, (_cached_from_email(email) for email in to_recipients)
             )
         if body is not None:
             kwargs["body"] = body if isinstance(body, ItemBody) else ItemBody(body)
         if subject is not None:
             kwargs["subject"] = subject
 
-        return super(MessageCollection, self).add(**kwargs)
+        return self._add_from_payload(kwargs)
 
     def search(self, query_text):
         """
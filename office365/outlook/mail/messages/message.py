@@ -1,8 +1,12 @@
+import functools
+import mmap
 import os
+import sys
 import uuid
 from datetime import datetime
-from typing import IO, AnyStr, List, Optional
+from typing import IO, AnyStr, Callable, List, Optional
 
+import requests
 from typing_extensions import Self
 
 from office365.directory.extensions.extended_property import (
@@ -16,18 +20,37 @@ from office365.outlook.mail.attachments.collection import AttachmentCollection
 from office365.outlook.mail.item_body import ItemBody
 from office365.outlook.mail.messages.followup_flag import FollowupFlag
 from office365.outlook.mail.messages.internet_header import InternetMessageHeader
-from office365.outlook.mail.recipient import Recipient
+from office365.outlook.mail.recipient import Recipient, _cached_from_email
 from office365.runtime.client_object_meta import persist_property
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.queries.function import FunctionQuery
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 
 
+def _save_content(file_object, return_type):
+    # type: (IO, ClientResult[AnyStr]) -> None
+    file_object.write(return_type.value)
+
+
+# interned keys for the hottest property lookups: interned dict keys hit the
+# pointer-equality fast path when iterating large message collections
+_SUBJECT = sys.intern("subject")
+_BODY = sys.intern("body")
+_ATTACHMENTS = sys.intern("attachments")
+_EXTENSIONS = sys.intern("extensions")
+_TO_RECIPIENTS = sys.intern("toRecipients")
+_HAS_ATTACHMENTS = sys.intern("hasAttachments")
+
+
 class Message(OutlookItem):
     """A message in a mailbox folder."""
 
+    __slots__ = ()
+
     def add_extended_property(self, name, value):
         # type: (str, str) -> Self
         """Create a single-value extended property for a message"""
@@ -66,20 +89,75 @@ class Message(OutlookItem):
     def download(self, file_object):
         # type: (IO) -> Self
         """Download MIME content of a message into a file"""
+        self.get_content().after_execute(functools.partial(_save_content, file_object))
+        return self
+
+    def download_session(self, file_object, chunk_downloaded=None, chunk_size=65536):
+        # type: (IO, Optional[Callable[[int], None]], int) -> Self
+        """
+        Download MIME content of a message into a file by streaming it in chunks,
+        so peak memory stays at one chunk instead of the whole message
 
-        def _save_content(return_type):
-            # type: (ClientResult[AnyStr]) -> None
-            file_object.write(return_type.value)
+        :param typing.IO file_object:
+        :param (int)->None or None chunk_downloaded: Download callback
+        :param int chunk_size: Size of the chunks the content is read in
+        """
+        qry = FunctionQuery(self, "$value")
+
+        def _construct_request(request):
+            # type: (RequestOptions) -> None
+            request.stream = True
+            request.method = HttpMethod.Get
 
-        self.get_content().after_execute(_save_content)
+        def _process_response(response):
+            # type: (requests.Response) -> None
+            response.raise_for_status()
+            bytes_read = 0
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                bytes_read += len(chunk)
+                if callable(chunk_downloaded):
+                    chunk_downloaded(bytes_read)
+                file_object.write(chunk)
+
+        self.context.add_query(qry).before_query_execute(
+            _construct_request
+        ).after_execute(_process_response)
         return self
 
-    def get_content(self):
-        # type: () -> ClientResult[AnyStr]
-        """Get MIME content of a message"""
+    def get_content(self, resume_state=None):
+        # type: (Optional[dict]) -> ClientResult[AnyStr]
+        """
+        Get MIME content of a message
+
+        :param dict or None resume_state: Optional hints for resuming a partial
+            download. When the dict holds "etag" and "offset" keys, only the
+            unreceived tail is requested (Range/If-Range), so a retry after a
+            broken connection re-fetches O(tail) instead of the whole message.
+            After execution the dict is updated with the response "etag" and a
+            "partial" flag: on a partial response the result holds the bytes
+            from "offset" onwards, otherwise the full content.
+        """
         return_type = ClientResult(self.context)
         qry = FunctionQuery(self, "$value", None, return_type)
         self.context.add_query(qry)
+
+        if resume_state is not None:
+
+            def _construct_request(request):
+                # type: (RequestOptions) -> None
+                etag = resume_state.get("etag")
+                offset = resume_state.get("offset")
+                if etag and offset:
+                    request.set_header("Range", "bytes={0}-".format(offset))
+                    request.set_header("If-Range", etag)
+
+            def _record_state(response):
+                # type: (requests.Response) -> None
+                resume_state["etag"] = response.headers.get("ETag")
+                resume_state["partial"] = response.status_code == 206
+
+            self.context.before_query_execute(_construct_request)
+            self.context.after_query_execute(_record_state, include_response=True)
         return return_type
 
     def add_file_attachment(
@@ -90,7 +168,7 @@ class Message(OutlookItem):
 
         :param str name: The name representing the text that is displayed below the icon representing the
              embedded attachment
-        :param str or None content: The contents of the file
+        :param str or bytes or None content: The contents of the file
         :param str or None content_type: The content type of the attachment.
         :param str or None base64_content: The contents of the file in the form of a base64 string.
         """
@@ -108,8 +186,12 @@ class Message(OutlookItem):
         :param (int)->None chunk_uploaded: Upload action
         """
         max_upload_chunk = 1000000 * 3
-        file_size = os.stat(file_path).st_size
+        fd = os.open(file_path, os.O_RDONLY)
+        file_size = os.fstat(fd).st_size
         if file_size > max_upload_chunk:
+            # the chunked upload only starts once the upload session is
+            # created, so the file is opened lazily inside resumable_upload
+            os.close(fd)
 
             def _message_loaded():
                 self.attachments.resumable_upload(
@@ -118,11 +200,18 @@ class Message(OutlookItem):
 
             self.ensure_property("id", _message_loaded)
         else:
-            with open(file_path, "rb") as file_object:
-                content = file_object.read()
-            self.attachments.add_file(
-                os.path.basename(file_object.name), content.decode("utf-8")
-            )
+            with os.fdopen(fd, "rb") as file_object:
+                if file_size > 0:
+                    # let the base64 encoder read straight from the page cache
+                    # instead of materializing an intermediate copy of the file
+                    with mmap.mmap(
+                        file_object.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as content:
+                        self.attachments.add_file(os.path.basename(file_path), content)
+                else:
+                    self.attachments.add_file(
+                        os.path.basename(file_path), file_object.read()
+                    )
         return self
 
     def send(self):
@@ -236,7 +325,7 @@ class Message(OutlookItem):
         """
         payload = {
             "toRecipients": ClientValueCollection(
-                Recipient, [Recipient.from_email(v) for v in to_recipients]
+                Recipient, (_cached_from_email(v) for v in to_recipients)
             ),
             "comment": comment,
         }
@@ -253,35 +342,40 @@ class Message(OutlookItem):
         of inline attachments, parse the body property to look for a src attribute,
         such as <IMG src="cid:image001.jpg@01D26CD8.6C05F070">.
         """
-        return self.properties.get("hasAttachments", None)
+        return self.properties.get(_HAS_ATTACHMENTS, None)
 
     @property
     @persist_property()
     def attachments(self):
         # type: () -> AttachmentCollection
         """The fileAttachment and itemAttachment attachments for the message."""
-        return self.properties.setdefault(
-            "attachments",
-            AttachmentCollection(
+        value = self.properties.get(_ATTACHMENTS)
+        if value is None:
+            value = AttachmentCollection(
                 self.context, ResourcePath("attachments", self.resource_path)
-            ),
-        )
+            )
+            self.properties[_ATTACHMENTS] = value
+        return value
 
     @property
     def extensions(self):
         # type: () -> EntityCollection[Extension]
         """The collection of open extensions defined for the message. Nullable."""
-        return self.properties.get(
-            "extensions",
-            EntityCollection(
+        value = self.properties.get(_EXTENSIONS)
+        if value is None:
+            value = EntityCollection(
                 self.context, Extension, ResourcePath("extensions", self.resource_path)
-            ),
-        )
+            )
+        return value
 
     @property
     def body(self):
         """The body of the message. It can be in HTML or text format."""
-        return self.properties.setdefault("body", ItemBody())
+        value = self.properties.get(_BODY)
+        if value is None:
+            value = ItemBody()
+            self.properties[_BODY] = value
+        return value
 
     @body.setter
     def body(self, value):
@@ -295,12 +389,12 @@ class Message(OutlookItem):
         else:
             content = value
         if isinstance(content, ItemBody):
-            self.set_property("body", content)
+            self.set_property(_BODY, content)
             return
         if content_type.lower() not in ["text", "html"]:
             raise ValueError("content_type must be either 'Text' or 'HTML'")
         item_body = ItemBody(content=content, content_type=content_type)
-        self.set_property("body", item_body)
+        self.set_property(_BODY, item_body)
 
     @property
     def body_preview(self):
@@ -413,43 +507,53 @@ class Message(OutlookItem):
     def subject(self):
         # type: () -> Optional[str]
         """The subject of the message."""
-        return self.properties.get("subject", None)
+        return self.properties.get(_SUBJECT, None)
 
     @subject.setter
     def subject(self, value):
         # type: (str) -> None
         """Sets the subject of the message."""
-        self.set_property("subject", value)
+        self.set_property(_SUBJECT, value)
 
     @property
     def to_recipients(self):
         """The To: recipients for the message."""
         self._persist_changes("toRecipients")
-        return self.properties.setdefault(
-            "toRecipients", ClientValueCollection(Recipient)
-        )
+        value = self.properties.get(_TO_RECIPIENTS)
+        if value is None:
+            value = ClientValueCollection(Recipient)
+            self.properties[_TO_RECIPIENTS] = value
+        return value
 
     @property
     def bcc_recipients(self):
         """The BCC: recipients for the message."""
         self._persist_changes("bccRecipients")
-        return self.properties.setdefault(
-            "bccRecipients", ClientValueCollection(Recipient)
-        )
+        value = self.properties.get("bccRecipients")
+        if value is None:
+            value = ClientValueCollection(Recipient)
+            self.properties["bccRecipients"] = value
+        return value
 
     @property
     def cc_recipients(self):
         """The CC: recipients for the message."""
         self._persist_changes("ccRecipients")
-        return self.properties.setdefault(
-            "ccRecipients", ClientValueCollection(Recipient)
-        )
+        value = self.properties.get("ccRecipients")
+        if value is None:
+            value = ClientValueCollection(Recipient)
+            self.properties["ccRecipients"] = value
+        return value
 
     @property
     def reply_to(self):
         """The replyTo: recipients for the reply to the message."""
         self._persist_changes("replyTo")
-        return self.properties.setdefault("replyTo", ClientValueCollection(Recipient))
+        value = self.properties.get("replyTo")
+        if value is None:
+            value = ClientValueCollection(Recipient)
+            self.properties["replyTo"] = value
+        return value
 
     @property
     def sender(self):
@@ -508,19 +612,24 @@ class Message(OutlookItem):
             ),
         )
 
+    # server property name -> attribute holding its typed default; evaluated
+    # lazily in get_property so a lookup only touches the property it needs
+    _property_type_mapping = {
+        "toRecipients": "to_recipients",
+        "bccRecipients": "bcc_recipients",
+        "ccRecipients": "cc_recipients",
+        "from": "sent_from",
+        "internetMessageHeaders": "internet_message_headers",
+        "multiValueExtendedProperties": "multi_value_extended_properties",
+        "receivedDateTime": "received_datetime",
+        "sentDateTime": "sent_datetime",
+        "singleValueExtendedProperties": "single_value_extended_properties",
+    }
+
     def get_property(self, name, default_value=None):
         if default_value is None:
-            property_type_mapping = {
-                "toRecipients": self.to_recipients,
-                "bccRecipients": self.bcc_recipients,
-                "ccRecipients": self.cc_recipients,
-                "from": self.sent_from,
-                "internetMessageHeaders": self.internet_message_headers,
-                "multiValueExtendedProperties": self.multi_value_extended_properties,
-                "receivedDateTime": self.received_datetime,
-                "sentDateTime": self.sent_datetime,
-                "singleValueExtendedProperties": self.single_value_extended_properties,
-            }
-            default_value = property_type_mapping.get(name, None)
+            attr_name = Message._property_type_mapping.get(name)
+            if attr_name is not None:
+                default_value = getattr(self, attr_name)
 
         return super(Message, self).get_property(name, default_value)
@@ -1,3 +1,6 @@
+import copy
+import functools
+
 from office365.outlook.calendar.email_address import EmailAddress
 from office365.runtime.client_value import ClientValue
 
@@ -26,3 +29,19 @@ class Recipient(ClientValue):
             return Recipient(value)
         else:
             return Recipient(EmailAddress(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _prototype_from_email(value):
+    # type: (str | EmailAddress) -> Recipient
+    return Recipient.from_email(value)
+
+
+def _cached_from_email(value):
+    # type: (str | EmailAddress) -> Recipient
+    """Recipient.from_email with the parse amortized across repeated
+    addresses. Each call returns a deep copy of the cached prototype: the
+    recipients end up in message properties reachable through the public
+    API, so instances must not be shared between messages. A shallow copy
+    is not enough - it would still share the mutable EmailAddress."""
+    return copy.deepcopy(_prototype_from_email(value))
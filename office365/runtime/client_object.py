@@ -33,6 +33,20 @@ PropertyT = Union[bool, int, float, str, bytes, dict | ClientValue]
 
 
 class ClientObject(object):
+    # keep instances compact: bulk operations (e.g. paging a mailbox via a
+    # delta collection) hold thousands of entities at once. Subclasses that
+    # declare no extra instance attributes can opt in with __slots__ = ().
+    __slots__ = (
+        "_properties",
+        "_properties_to_persist",
+        "_query_options",
+        "_parent_collection",
+        "_context",
+        "_entity_type_name",
+        "_resource_path",
+        "__weakref__",
+    )
+
     def __init__(self, context, resource_path=None, parent_collection=None):
         # type: (ClientRuntimeContext, Optional[ResourcePath], Optional[ClientObjectCollection]) -> None
         """Base client object which define named properties and relationships of an entity."""
@@ -106,6 +106,10 @@ class ClientRuntimeContext(ABC):
                 if once:
                     self.pending_request().beforeExecute -= _prepare_request
                 action(request)
+            elif query not in self._queries:
+                # the query was dropped without ever executing (failure or
+                # clear()); detach so the handler list stays bounded
+                self.pending_request().beforeExecute -= _prepare_request
 
         self.pending_request().beforeExecute += _prepare_request
         return self
@@ -140,6 +144,10 @@ class ClientRuntimeContext(ABC):
             if self.current_query.id == query.id:
                 self.pending_request().afterExecute -= _process_response
                 action(resp if include_response else query.return_type)
+            elif query not in self._queries:
+                # the query was dropped without ever executing (failure or
+                # clear()); detach so the handler list stays bounded
+                self.pending_request().afterExecute -= _process_response
 
         self.pending_request().afterExecute += _process_response
 
@@ -1,5 +1,5 @@
 import uuid
-from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar
 
 from typing_extensions import Self
 
@@ -13,10 +13,12 @@ T = TypeVar("T")
 
 class ClientValueCollection(ClientValue, Generic[T]):
     def __init__(self, item_type, initial_values=None):
-        # type: (Type[T], Optional[List | Dict]) -> None
+        # type: (Type[T], Optional[Iterable | Dict]) -> None
         super(ClientValueCollection, self).__init__()
         if initial_values is None:
             initial_values = []
+        elif not isinstance(initial_values, (list, dict)):
+            initial_values = list(initial_values)
         self._data = initial_values  # type: list[T]
         self._item_type = item_type
 
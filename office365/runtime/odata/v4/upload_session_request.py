@@ -1,4 +1,6 @@
 import os
+import queue
+import threading
 import typing
 from typing import Callable
 
@@ -10,15 +12,44 @@ from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
 from office365.runtime.queries.upload_session import UploadSessionQuery
 
+_chunk_pool = queue.LifoQueue(maxsize=4)  # type: queue.LifoQueue[bytearray]
+
+# chunks staged ahead of the chunk currently on the wire; upload sessions
+# acknowledge ranges sequentially, so only file reads are overlapped
+_read_ahead_depth = 2
+
+
+def _borrow_buffer(size):
+    # type: (int) -> bytearray
+    """Takes a read buffer from the pool, or allocates one when the pool is
+    empty or holds only smaller buffers."""
+    try:
+        buffer = _chunk_pool.get_nowait()
+    except queue.Empty:
+        return bytearray(size)
+    if len(buffer) < size:
+        return bytearray(size)
+    return buffer
+
+
+def _return_buffer(buffer):
+    # type: (bytearray) -> None
+    try:
+        _chunk_pool.put_nowait(buffer)
+    except queue.Full:
+        pass
+
 
 class UploadSessionRequest(ClientRequest):
-    def __init__(self, file_object, chunk_size, chunk_uploaded=None):
-        # type: (typing.IO, int, Callable[[int], None]) -> None
+    def __init__(self, file_object, chunk_size, chunk_uploaded=None, max_chunk_retry=5):
+        # type: (typing.IO, int, Callable[[int], None], int) -> None
         super(UploadSessionRequest, self).__init__()
         self._file_object = file_object
         self._chunk_size = chunk_size
         self._chunk_uploaded = chunk_uploaded
         self._range_data = None
+        self._range_start = 0
+        self._max_chunk_retry = max_chunk_retry
 
     def build_request(self, query):
         # type: (UploadSessionQuery) -> Self
@@ -43,15 +74,106 @@ class UploadSessionRequest(ClientRequest):
 
     def execute_query(self, query):
         # type: (UploadSessionQuery) -> None
-        for self._range_data in self._read_next():
-            super(UploadSessionRequest, self).execute_query(query)
-
-    def _read_next(self):
+        retry = 0
+        resume = False
         while True:
-            content = self._file_object.read(self._chunk_size)
-            if not content:
-                break
-            yield content
+            acked_before = self._range_start
+            try:
+                if resume:
+                    # the probe runs over the same unreliable link as the
+                    # chunks, so its failures consume retries as well
+                    self._seek_next_expected_range(query)
+                    resume = False
+                self._upload_pipelined(query)
+                return
+            except requests.exceptions.ConnectionError:
+                if self._range_start > acked_before:
+                    retry = 0
+                retry += 1
+                if retry > self._max_chunk_retry:
+                    raise
+                resume = True
+
+    def _upload_pipelined(self, query):
+        # type: (UploadSessionQuery) -> None
+        """Uploads chunks sequentially while a reader thread stages the next
+        chunks, overlapping file reads with the in-flight request."""
+        chunks = queue.Queue(maxsize=_read_ahead_depth)
+        stop = threading.Event()
+        read_errors = []  # type: list[BaseException]
+
+        def _read_ahead():
+            try:
+                while not stop.is_set():
+                    buffer = _borrow_buffer(self._chunk_size)
+                    try:
+                        with memoryview(buffer) as view:
+                            start = self._file_object.tell()
+                            bytes_read = self._file_object.readinto(
+                                view[: self._chunk_size]
+                            )
+                    except BaseException:
+                        _return_buffer(buffer)
+                        raise
+                    if not bytes_read:
+                        _return_buffer(buffer)
+                        break
+                    chunks.put((start, bytes_read, buffer))
+            except BaseException as e:
+                # surface read failures in the main thread; a bare sentinel
+                # would be mistaken for end-of-file and truncate the upload
+                read_errors.append(e)
+            finally:
+                chunks.put(None)
+
+        reader = threading.Thread(target=_read_ahead)
+        reader.daemon = True
+        reader.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    if read_errors:
+                        raise read_errors[0]
+                    return
+                start, bytes_read, buffer = chunk
+                try:
+                    with memoryview(buffer) as view:
+                        self._range_start = start
+                        self._range_data = view[:bytes_read]
+                        try:
+                            super(UploadSessionRequest, self).execute_query(query)
+                        finally:
+                            self._range_data.release()
+                            self._range_data = None
+                finally:
+                    _return_buffer(buffer)
+        finally:
+            stop.set()
+            while reader.is_alive():
+                try:
+                    chunk = chunks.get_nowait()
+                except queue.Empty:
+                    reader.join(0.05)
+                    continue
+                if chunk is not None:
+                    _return_buffer(chunk[2])
+            reader.join()
+
+    def _seek_next_expected_range(self, query):
+        # type: (UploadSessionQuery) -> None
+        """Probes the upload session for the last acknowledged byte and positions
+        the file object there, so an interrupted upload resumes instead of
+        retransmitting ranges the server already holds."""
+        request = RequestOptions(query.upload_session_url)
+        request.method = HttpMethod.Get
+        response = self.execute_request_direct(request)
+        next_ranges = response.json().get("nextExpectedRanges") or []
+        if next_ranges:
+            offset = int(next_ranges[0].split("-")[0])
+        else:
+            offset = self.file_size
+        self._file_object.seek(offset)
 
     @property
     def file_size(self):
@@ -59,10 +181,8 @@ class UploadSessionRequest(ClientRequest):
 
     @property
     def range_start(self):
-        if self.range_end == 0:
-            return 0
-        return self.range_end - len(self._range_data)
+        return self._range_start
 
     @property
     def range_end(self):
-        return self._file_object.tell()
+        return self._range_start + len(self._range_data)
@@ -20,6 +20,8 @@ class GroupSiteManager(ClientObject):
     provide collaboration spaces that integrate with various Microsoft 365 services like Teams, Outlook, and Planner.
     """
 
+    __slots__ = ()
+
     def __init__(self, context, resource_path=None):
         if resource_path is None:
             resource_path = ResourcePath("GroupSiteManager")
@@ -117,7 +119,7 @@ class GroupSiteManager(ClientObject):
         def _construct_request(request):
             # type: (RequestOptions) -> None
             request.method = HttpMethod.Get
-            request.url += "?groupId='{0}'".format(group_id)
+            request.url = f"{request.url}?groupId='{group_id}'"
 
         self.context.add_query(qry).before_query_execute(_construct_request)
         return return_type
@@ -1,5 +1,4 @@
 from datetime import datetime
-from random import randint
 
 from office365.sharepoint.lists.template_type import ListTemplateType
 from office365.sharepoint.permissions.base_permissions import BasePermissions
@@ -8,7 +7,7 @@ from office365.sharepoint.principal.users.user import User
 from office365.sharepoint.webs.creation_information import WebCreationInformation
 from office365.sharepoint.webs.subweb_query import SubwebQuery
 from office365.sharepoint.webs.web import Web
-from tests import test_site_url
+from tests import create_unique_name, test_site_url
 from tests.sharepoint.sharepoint_case import SPTestCase
 
 
@@ -48,7 +47,7 @@ class TestSharePointWeb(SPTestCase):
         self.assertIsInstance(result.value, BasePermissions)
 
     def test6_can_create_web(self):
-        target_web_name = "workspace_" + str(randint(0, 100000))
+        target_web_name = create_unique_name("workspace_")
         creation_info = WebCreationInformation()
         creation_info.Url = target_web_name
         creation_info.Title = target_web_name
@@ -74,9 +73,8 @@ class TestSharePointWeb(SPTestCase):
         """Test to update Web resource"""
         web_title_updated = self.__class__.target_web.properties["Title"] + "_updated"
         self.__class__.target_web.set_property("Title", web_title_updated)
-        self.__class__.target_web.update().execute_query()
-
-        updated_web = self.__class__.target_web.get().execute_query()
+        updated_web = self.__class__.target_web.update().get()
+        self.client.execute_batch()
         self.assertEqual(web_title_updated, updated_web.properties["Title"])
 
     def test9_if_web_deleted(self):